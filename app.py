@@ -1,10 +1,19 @@
 import streamlit as st
-import requests
-import xml.etree.ElementTree as ET
+import aiohttp
+import asyncio
+from lxml import etree
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from dataclasses import dataclass
 from io import BytesIO
 import concurrent.futures
+import itertools
+import threading
 import time
+import zlib
+from urllib.parse import urlparse
 
 # Page config
 st.set_page_config(
@@ -13,8 +22,9 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS
-st.markdown("""
+# Custom CSS — a module constant so Streamlit's markdown de-duplication can
+# cache the block across reruns.
+PAGE_CSS = """
     <style>
     .main-header {
         font-size: 2.5rem;
@@ -52,67 +62,372 @@ st.markdown("""
         color: #C62828;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
 
-def extract_urls_from_sitemap(sitemap_url):
+st.markdown(PAGE_CSS, unsafe_allow_html=True)
+
+SITEMAP_NS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+URL_TAG = f'{{{SITEMAP_NS}}}url'
+SITEMAP_TAG = f'{{{SITEMAP_NS}}}sitemap'
+# Some sitemaps omit the xmlns declaration entirely, so match bare tags too.
+PARSE_TAGS = (URL_TAG, SITEMAP_TAG, 'url', 'sitemap')
+
+# Cap on concurrently fetched sitemaps per top-level extraction, so a large
+# index can't recursively flood the host (or the connector) with requests.
+SITEMAP_FETCH_CONCURRENCY = 20
+
+SITEMAP_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+SITEMAP_HEADERS = {
+    'User-Agent': 'SitemapSage/1.0 (+https://github.com/boopin/xml-sitemap-extractor)',
+    'Accept-Encoding': 'gzip, deflate'
+}
+
+# Transient fetch failures get this many extra attempts, with exponential
+# backoff starting at SITEMAP_RETRY_BACKOFF seconds.
+SITEMAP_RETRIES = 2
+SITEMAP_RETRY_BACKOFF = 0.3
+
+# How many levels of nested sitemap indexes to follow; guards against
+# malformed or self-referencing indexes recursing forever.
+MAX_SITEMAP_DEPTH = 5
+
+async def extract_urls_from_sitemap(sitemap_url, session, semaphore, seen, errors, depth=0):
     try:
-        response = requests.get(sitemap_url, timeout=10)
-        response.raise_for_status()
-        
-        root = ET.fromstring(response.content)
-        namespaces = {
-            'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9',
-            'xhtml': 'http://www.w3.org/1999/xhtml'
-        }
-        
+        child_urls = []
         urls = []
         last_modified = []
         change_freq = []
         priority = []
         source_sitemap = []
-        
-        if 'sitemapindex' in root.tag:
-            for sitemap in root.findall('.//ns:loc', namespaces):
-                sub_df = extract_urls_from_sitemap(sitemap.text)
-                if not sub_df.empty:
-                    urls.extend(sub_df['URL'].tolist())
-                    last_modified.extend(sub_df['Last Modified'].tolist())
-                    change_freq.extend(sub_df['Change Frequency'].tolist())
-                    priority.extend(sub_df['Priority'].tolist())
-                    source_sitemap.extend([sitemap_url] * len(sub_df))
-        else:
-            for url in root.findall('.//ns:url', namespaces):
-                loc = url.find('ns:loc', namespaces)
-                if loc is not None:
-                    urls.append(loc.text)
-                    lastmod = url.find('ns:lastmod', namespaces)
-                    changefreq = url.find('ns:changefreq', namespaces)
-                    pri = url.find('ns:priority', namespaces)
-                    
-                    last_modified.append(lastmod.text if lastmod is not None else None)
-                    change_freq.append(changefreq.text if changefreq is not None else None)
-                    priority.append(pri.text if pri is not None else None)
+
+        def handle_element(elem):
+            loc = lastmod = changefreq = pri = None
+            for child in elem.iterchildren():
+                if not isinstance(child.tag, str):
+                    continue
+                name = etree.QName(child).localname
+                if name == 'loc':
+                    loc = child.text
+                elif name == 'lastmod':
+                    lastmod = child.text
+                elif name == 'changefreq':
+                    changefreq = child.text
+                elif name == 'priority':
+                    pri = child.text
+            if loc:
+                if etree.QName(elem).localname == 'sitemap':
+                    child_urls.append(loc)
+                elif loc not in seen:
+                    # One shared set per extraction drops duplicates across
+                    # sibling sitemaps as they are discovered, instead of a
+                    # full dedup pass over the merged result.
+                    seen.add(loc)
+                    urls.append(loc)
+                    last_modified.append(lastmod)
+                    change_freq.append(changefreq)
+                    priority.append(pri)
                     source_sitemap.append(sitemap_url)
-        
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+        # Feed the body into the parser as chunks arrive, so parsing overlaps
+        # the download and the full payload is never buffered. Connection
+        # drops and timeouts are retried with backoff; anything parsed from a
+        # half-received body is discarded first.
+        for attempt in range(SITEMAP_RETRIES + 1):
+            parser = etree.XMLPullParser(events=('end',), tag=PARSE_TAGS)
+            try:
+                async with semaphore:
+                    async with session.get(sitemap_url, timeout=SITEMAP_TIMEOUT, headers=SITEMAP_HEADERS) as response:
+                        response.raise_for_status()
+                        # aiohttp undoes transport-level gzip itself, but
+                        # .xml.gz files arrive as raw gzip bytes; sniff the
+                        # magic and stream-decompress those.
+                        decompressor = None
+                        first_chunk = True
+                        async for chunk in response.content.iter_chunked(65536):
+                            if first_chunk:
+                                first_chunk = False
+                                if chunk[:2] == b'\x1f\x8b':
+                                    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                            if decompressor is not None:
+                                chunk = decompressor.decompress(chunk)
+                                if not chunk:
+                                    continue
+                            parser.feed(chunk)
+                            for _, elem in parser.read_events():
+                                handle_element(elem)
+                break
+            except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError):
+                if attempt == SITEMAP_RETRIES:
+                    raise
+                # Un-mark locs from the half-received body too, or the
+                # re-parse would skip them all as duplicates.
+                seen.difference_update(urls)
+                for partial in (child_urls, urls, last_modified, change_freq, priority, source_sitemap):
+                    partial.clear()
+                await asyncio.sleep(SITEMAP_RETRY_BACKOFF * 2 ** attempt)
+        parser.close()
+        for _, elem in parser.read_events():
+            handle_element(elem)
+        # Free the parent document before recursing, so an index's (mostly
+        # cleared) tree isn't kept alive under every child fetch.
+        del parser
+
+        if child_urls:
+            if depth >= MAX_SITEMAP_DEPTH:
+                errors.append(f"Skipping sitemaps nested below {sitemap_url}: deeper than {MAX_SITEMAP_DEPTH} levels")
+                return pd.DataFrame()
+            sub_dfs = await asyncio.gather(
+                *(extract_urls_from_sitemap(url, session, semaphore, seen, errors, depth + 1) for url in child_urls),
+                return_exceptions=True
+            )
+            frames = [df for df in sub_dfs if isinstance(df, pd.DataFrame) and not df.empty]
+            if frames:
+                return pd.concat(frames, ignore_index=True)
+            return pd.DataFrame()
+
+        # Hand pandas pre-sized object arrays so construction skips
+        # element-by-element type inference over the Python lists.
+        n = len(urls)
         return pd.DataFrame({
-            'URL': urls,
-            'Last Modified': last_modified,
-            'Change Frequency': change_freq,
-            'Priority': priority,
-            'Source Sitemap': source_sitemap
+            'URL': np.fromiter(urls, dtype=object, count=n),
+            'Last Modified': np.fromiter(last_modified, dtype=object, count=n),
+            'Change Frequency': np.fromiter(change_freq, dtype=object, count=n),
+            'Priority': np.fromiter(priority, dtype=object, count=n),
+            'Source Sitemap': np.fromiter(source_sitemap, dtype=object, count=n)
         })
-    
+
     except Exception as e:
-        st.error(f"Error processing {sitemap_url}: {str(e)}")
+        # Workers can't touch Streamlit widgets safely; collect the message
+        # and let main() render one consolidated error list.
+        errors.append(f"Error processing {sitemap_url}: {str(e)}")
         return pd.DataFrame()
 
+_rng = np.random.default_rng()
+
+# Friendly labels for the failure modes the checker reports most often,
+# matched by isinstance so subclasses classify correctly (SSL first, since
+# connector SSL errors also inherit from ClientConnectionError).
+ERROR_MAP = (
+    (aiohttp.ClientSSLError, 'SSL Error', 'SSL certificate verification failed'),
+    (asyncio.TimeoutError, 'Timeout', 'Request timed out'),
+    (aiohttp.ClientConnectionError, 'Connection Error', 'Unable to connect to the server'),
+)
+
+@dataclass(slots=True)
+class URLStatus:
+    url: str
+    final_url: str = None
+    http_code: int = None
+    response_time: float = None
+    # None means not applicable (plain-HTTP URL) or never reached.
+    ssl_valid: bool = None
+    redirects: int = 0
+    server: str = None
+    content_type: str = None
+    status: str = None
+    error: str = None
+
+# Maps result-table column names to URLStatus fields.
+STATUS_COLUMNS = {
+    'URL': 'url',
+    'Final URL': 'final_url',
+    'HTTP Code': 'http_code',
+    'Response Time (s)': 'response_time',
+    'SSL Valid': 'ssl_valid',
+    'Redirects': 'redirects',
+    'Server': 'server',
+    'Content Type': 'content_type',
+    'Status': 'status',
+    'Error': 'error',
+}
+
+def status_styles(statuses):
+    """Vectorized row colors for the Status column: one np.where pass
+    instead of a Python call per cell."""
+    return np.where(
+        statuses == 'OK', 'background-color: #E8F5E9',
+        np.where(statuses == 'Broken', 'background-color: #FFEBEE', 'background-color: #FFF8E1')
+    )
+
+class URLStatusChecker:
+    def __init__(self, timeout=10, max_workers=10, sample_size=None, method='HEAD'):
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_workers = max_workers
+        self.sample_size = sample_size
+        self.method = method
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (compatible; SitemapSage/1.0; +https://github.com/boopin/xml-sitemap-extractor)',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
+        }
+        # Certificate validity per hostname; sitemap URL lists mostly share
+        # one host, so a bad cert is discovered once instead of per URL.
+        self._host_ssl = {}
+
+    def _sample_urls(self, urls):
+        if self.sample_size and len(urls) > self.sample_size:
+            indices = _rng.choice(len(urls), size=self.sample_size, replace=False)
+            return [urls[i] for i in indices]
+        return list(urls)
+
+    async def _check_url_status(self, session, url):
+        result = URLStatus(url=url)
+
+        async def fetch(method, ssl_arg, range_probe=False):
+            # The fallback GET asks for a single byte, so servers that
+            # refuse HEAD answer 206 with a one-byte body instead of
+            # shipping the whole page. The session carries the default
+            # headers; only the Range probe adds one.
+            async with session.request(
+                method,
+                url,
+                headers={'Range': 'bytes=0-0'} if range_probe else None,
+                timeout=self.timeout,
+                allow_redirects=True,
+                ssl=ssl_arg
+            ) as response:
+                # Some servers (and CDNs) reject HEAD with 405/501 or even
+                # 403; retry those with a ranged GET so they aren't
+                # reported as broken.
+                if method == 'HEAD' and response.status in (403, 405, 501):
+                    await fetch('GET', ssl_arg, range_probe=True)
+                    return
+                result.final_url = str(response.url)
+                result.http_code = response.status
+                result.redirects = len(response.history)
+                result.server = response.headers.get('Server')
+                result.content_type = response.headers.get('Content-Type')
+                result.status = 'OK' if response.status < 400 else 'Broken'
+
+        try:
+            start_time = time.time()
+            # Verify the certificate on the main request; only on an SSL
+            # failure retry unverified so broken-cert pages still report
+            # their status code. Hosts already known to have a bad cert go
+            # straight to the unverified request; plain-HTTP URLs have no
+            # certificate to judge and keep ssl_valid at None.
+            if urlparse(url).scheme != 'https':
+                await fetch(self.method, True)
+            elif self._host_ssl.get(urlparse(url).hostname) is False:
+                await fetch(self.method, False)
+                result.ssl_valid = False
+            else:
+                try:
+                    await fetch(self.method, True)
+                    result.ssl_valid = True
+                except aiohttp.ClientSSLError:
+                    await fetch(self.method, False)
+                    result.ssl_valid = False
+                self._host_ssl[urlparse(url).hostname] = result.ssl_valid
+            result.response_time = round(time.time() - start_time, 3)
+
+        except Exception as e:
+            for exc_class, status, message in ERROR_MAP:
+                if isinstance(e, exc_class):
+                    result.status, result.error = status, message
+                    break
+            else:
+                result.status, result.error = 'Error', str(e)
+
+        return result
+
+    async def _batch_async(self, urls, progress_callback=None):
+        # Sitemap-derived URL lists are dominated by a handful of hosts, so
+        # cache DNS answers and keep per-host concurrency below the global
+        # limit to maximize keep-alive reuse.
+        connector = aiohttp.TCPConnector(
+            limit=self.max_workers,
+            limit_per_host=min(10, self.max_workers),
+            ttl_dns_cache=300
+        )
+        async with aiohttp.ClientSession(connector=connector, headers=self.headers) as session:
+            # Preallocate one typed array per column and fill by index, so
+            # pandas never has to re-infer a list of per-URL dicts. Defaults
+            # double as the error-case values (-1 code, NaN time).
+            n = len(urls)
+            cols = {
+                'URL': np.empty(n, dtype=object),
+                'Final URL': np.empty(n, dtype=object),
+                'HTTP Code': np.full(n, -1, dtype=np.int32),
+                'Response Time (s)': np.full(n, np.nan, dtype=np.float32),
+                'SSL Valid': np.empty(n, dtype=object),
+                'Redirects': np.zeros(n, dtype=np.int32),
+                'Server': np.empty(n, dtype=object),
+                'Content Type': np.empty(n, dtype=object),
+                'Status': np.empty(n, dtype=object),
+                'Error': np.empty(n, dtype=object),
+            }
+
+            async def check_at(index, url):
+                return index, await self._check_url_status(session, url)
+
+            # Keep a sliding window of 2x max_workers tasks in flight rather
+            # than materializing one task per URL up front; memory stays
+            # bounded for huge batches and first results arrive sooner.
+            pending_urls = enumerate(urls)
+            in_flight = {
+                asyncio.ensure_future(check_at(index, url))
+                for index, url in itertools.islice(pending_urls, 2 * self.max_workers)
+            }
+            completed = 0
+            while in_flight:
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index, result = task.result()
+                    for column, field in STATUS_COLUMNS.items():
+                        value = getattr(result, field)
+                        if value is not None:
+                            cols[column][index] = value
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(completed, n)
+                for index, url in itertools.islice(pending_urls, len(done)):
+                    in_flight.add(asyncio.ensure_future(check_at(index, url)))
+            return pd.DataFrame(cols)
+
+    def batch_url_status_check(self, urls, progress_callback=None):
+        # Concatenated sub-sitemaps routinely repeat URLs; check each once,
+        # keeping first-seen order so sampling stays stable.
+        unique_urls = list(dict.fromkeys(urls))
+        sampled_urls = self._sample_urls(unique_urls)
+        return asyncio.run(self._batch_async(sampled_urls, progress_callback))
+
+class SitemapExtractionError(Exception):
+    """An extraction that produced no URLs, carrying the collected errors."""
+    def __init__(self, errors):
+        super().__init__(errors[0] if errors else "sitemap extraction failed")
+        self.errors = errors
+
+async def _extract_sitemap(url):
+    connector = aiohttp.TCPConnector(limit=50, ttl_dns_cache=300)
+    semaphore = asyncio.Semaphore(SITEMAP_FETCH_CONCURRENCY)
+    errors = []
+    async with aiohttp.ClientSession(connector=connector) as session:
+        df = await extract_urls_from_sitemap(url, session, semaphore, set(), errors)
+    if df.empty and errors:
+        # Raise instead of returning, so st.cache_data (which does not
+        # cache exceptions) won't pin a transient failure for the TTL.
+        raise SitemapExtractionError(errors)
+    return df, errors
+
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False, persist='disk')
+def extract_sitemap_cached(url):
+    return asyncio.run(_extract_sitemap(url))
+
 def process_sitemap(url):
     start_time = time.time()
-    df = extract_urls_from_sitemap(url)
+    try:
+        df, errors = extract_sitemap_cached(url)
+    except SitemapExtractionError as e:
+        df, errors = pd.DataFrame(), e.errors
     processing_time = time.time() - start_time
     return {
         'url': url,
         'df': df,
+        'errors': errors,
         'processing_time': processing_time,
         'success': not df.empty
     }
@@ -148,6 +463,9 @@ def main():
             content = uploaded_file.getvalue().decode()
             sitemap_urls = [url.strip() for url in content.split('\n') if url.strip()]
     
+    check_health = st.checkbox("🩺 Check URL health on a sample of extracted URLs")
+    prepare_excel = st.checkbox("📊 Prepare Excel export (slower for large results)")
+
     # Process button
     if st.button("🔍 Process Sitemaps", use_container_width=True):
         if sitemap_urls:
@@ -155,31 +473,65 @@ def main():
             status_container = st.empty()
             
             # Initialize results storage
-            all_results = pd.DataFrame()
+            frames = []
+            all_errors = []
             total_urls = 0
             successful_sitemaps = 0
             failed_sitemaps = 0
             
-            # Process sitemaps with concurrent execution
-            with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-                futures = {executor.submit(process_sitemap, url): url for url in sitemap_urls}
-                
+            # Process sitemaps with concurrent execution. The pool scales
+            # with the batch so many-host runs aren't capped at a handful of
+            # workers, while a per-host semaphore keeps any single origin at
+            # two concurrent fetches to avoid tripping rate limits.
+            host_semaphores = {
+                host: threading.Semaphore(2)
+                for host in {urlparse(url).netloc for url in sitemap_urls}
+            }
+
+            def process_bounded(url):
+                with host_semaphores[urlparse(url).netloc]:
+                    return process_sitemap(url)
+
+            last_update = 0.0
+            pool_size = min(32, len(sitemap_urls))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=pool_size) as executor:
+                futures = {executor.submit(process_bounded, url): url for url in sitemap_urls}
+
                 for i, future in enumerate(concurrent.futures.as_completed(futures)):
                     result = future.result()
-                    progress = (i + 1) / len(sitemap_urls)
-                    progress_bar.progress(progress)
-                    
+                    all_errors.extend(result['errors'])
+
                     if result['success']:
                         successful_sitemaps += 1
                         total_urls += len(result['df'])
-                        all_results = pd.concat([all_results, result['df']], ignore_index=True)
+                        frames.append(result['df'])
                         status_text = f"✅ Processed {result['url']} ({len(result['df'])} URLs, {result['processing_time']:.2f}s)"
                     else:
                         failed_sitemaps += 1
                         status_text = f"❌ Failed to process {result['url']}"
-                    
-                    status_container.markdown(f"<div class='processing-status {'success' if result['success'] else 'error'}'>{status_text}</div>", unsafe_allow_html=True)
-            
+
+                    # Each update is a websocket rerender, so cap them at
+                    # ~5/s and always render the final tally.
+                    now = time.monotonic()
+                    if now - last_update >= 0.2 or i + 1 == len(sitemap_urls):
+                        progress_bar.progress((i + 1) / len(sitemap_urls))
+                        status_container.markdown(f"<div class='processing-status {'success' if result['success'] else 'error'}'>{status_text}</div>", unsafe_allow_html=True)
+                        last_update = now
+
+            all_results = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+            # Columns like Change Frequency repeat a handful of values across
+            # the whole result; storing them as categoricals replaces one
+            # Python string per row with a small int code.
+            for col in ('Change Frequency', 'Priority', 'Source Sitemap'):
+                if col in all_results and all_results[col].nunique() / max(len(all_results), 1) < 0.1:
+                    all_results[col] = all_results[col].astype('category')
+
+            if all_errors:
+                with st.expander(f"⚠️ {len(all_errors)} errors during extraction", expanded=False):
+                    for message in all_errors:
+                        st.markdown(f"- {message}")
+
             # Display results
             if not all_results.empty:
                 st.markdown(f"<p class='url-count'>📊 Processed {successful_sitemaps:,} sitemaps ({failed_sitemaps} failed)<br>Found {total_urls:,} unique URLs!</p>", unsafe_allow_html=True)
@@ -201,8 +553,11 @@ def main():
                 # Export options
                 col1, col2 = st.columns(2)
                 
-                # CSV export
-                csv = all_results.to_csv(index=False).encode('utf-8')
+                # CSV export — Arrow writes UTF-8 straight from its column
+                # buffers, skipping pandas' row-by-row Python CSV writer.
+                sink = pa.BufferOutputStream()
+                pacsv.write_csv(pa.Table.from_pandas(all_results, preserve_index=False), sink)
+                csv = sink.getvalue().to_pybytes()
                 col1.download_button(
                     label="📥 Download CSV",
                     data=csv,
@@ -211,19 +566,55 @@ def main():
                     use_container_width=True
                 )
                 
-                # Excel export
-                buffer = BytesIO()
-                with pd.ExcelWriter(buffer, engine='xlsxwriter') as writer:
-                    all_results.to_excel(writer, index=False, sheet_name='URLs')
-                    sitemap_stats.to_excel(writer, index=False, sheet_name='Sitemap Stats')
-                excel_data = buffer.getvalue()
-                col2.download_button(
-                    label="📊 Download Excel",
-                    data=excel_data,
-                    file_name="sitemap_urls.xlsx",
-                    mime="application/vnd.ms-excel",
-                    use_container_width=True
-                )
+                # Excel export — only built when asked for, since writing
+                # the workbook materializes every cell in memory.
+                if prepare_excel:
+                    buffer = BytesIO()
+                    # strings_to_urls skips the per-cell hyperlink regex,
+                    # which dominates on URL-heavy data. constant_memory is
+                    # off on purpose: to_excel writes column-by-column and
+                    # row-flushing mode discards cells on already-flushed
+                    # rows.
+                    excel_options = {'strings_to_urls': False}
+                    with pd.ExcelWriter(buffer, engine='xlsxwriter', engine_kwargs={'options': excel_options}) as writer:
+                        all_results.to_excel(writer, index=False, sheet_name='URLs')
+                        sitemap_stats.to_excel(writer, index=False, sheet_name='Sitemap Stats')
+                    excel_data = buffer.getvalue()
+                    col2.download_button(
+                        label="📊 Download Excel",
+                        data=excel_data,
+                        file_name="sitemap_urls.xlsx",
+                        mime="application/vnd.ms-excel",
+                        use_container_width=True
+                    )
+                else:
+                    col2.caption("Tick “Prepare Excel export” before processing to enable the Excel download.")
+
+                # URL health check on a sample of the extracted URLs
+                if check_health:
+                    st.subheader("URL Health Status (Sample)")
+                    checker = URLStatusChecker(timeout=10, max_workers=10, sample_size=50)
+                    health_bar = st.progress(0)
+                    last_update = [0.0]
+
+                    # Every update is a full Streamlit rerender message, so
+                    # throttle to ~10/s but always show the final state.
+                    def update_health_progress(done, total):
+                        now = time.monotonic()
+                        if now - last_update[0] > 0.1 or done == total:
+                            health_bar.progress(done / total)
+                            last_update[0] = now
+
+                    status_df = checker.batch_url_status_check(
+                        all_results['URL'].tolist(),
+                        progress_callback=update_health_progress
+                    )
+                    if len(status_df) <= 10000:
+                        st.dataframe(status_df.style.apply(status_styles, subset=['Status']), height=300)
+                    else:
+                        # A Styler serializes per-cell HTML; past ~10k rows the
+                        # plain table renders far faster.
+                        st.dataframe(status_df, height=300)
         else:
             st.warning("⚠️ Please provide at least one sitemap URL")
     